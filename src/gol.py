@@ -11,13 +11,43 @@ for simulating Conway's Game of Life and its variations.
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import imageio
-import scipy.signal
+from PIL import Image, ImageDraw, ImageFont, GifImagePlugin
+import hashlib
 import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
 from tqdm import tqdm
 
+# Numba is optional and only needed by NumbaGame
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# CuPy is optional and only needed by CupyGame
+try:
+    import cupy
+    import cupyx.scipy.ndimage
+except ImportError:
+    cupy = None
+
+# PyTorch is optional and only needed by TorchGame
+try:
+    import torch
+    import torch.nn.functional as F
+except ImportError:
+    torch = None
+
 # --- Main Game of Life Class ---
 
+# Game.update works through the grid in bands of rows about this many bytes
+# wide, so each band and its work arrays stay in the CPU cache
+_BAND_BYTES = 128 * 1024
+
 class Game():
     """
     Manages the state and rules of a Game of Life simulation.
@@ -37,26 +67,44 @@ class Game():
                                         Defaults to standard B3/S23 rules.
             birth_rules (list[int]): A list of neighbor counts for a dead cell to be born.
                                      Defaults to standard B3/S23 rules.
-            initial_pattern (np.ndarray, optional): A custom pattern to place on the grid.
+            initial_pattern (array-like, optional): A custom pattern to place on the grid.
                                                     Defaults to None, which creates an empty grid.
 
+        Raises:
+            ValueError: If a rule holds a neighbor count outside 0 to 8.
+
         Attributes:
             rows (int): Stores the number of rows.
             columns (int): Stores the number of columns.
             grid (np.ndarray): A 2D NumPy array representing the cell states
                 (0 for dead, 1 for alive).
-            survival_rules (list[int]): Stores the survival rules.
-            birth_rules (list[int]): Stores the birth rules.
+            survival_rules (frozenset[int]): Stores the survival rules (read-only).
+            birth_rules (frozenset[int]): Stores the birth rules (read-only).
         """
 
 
         self.rows = rows
         self.columns = columns
-        self.survival_rules = survival_rules
-        self.birth_rules = birth_rules
+        self._survival_rules = frozenset(survival_rules)
+        self._birth_rules = frozenset(birth_rules)
+
+        # The counts index the rule table below, so they have to be checked
+        for name, rules in (("survival_rules", self._survival_rules), ("birth_rules", self._birth_rules)):
+            invalid = sorted(count for count in rules if not 0 <= count <= 8)
+            if invalid:
+                raise ValueError(f"{name} must be neighbor counts from 0 to 8, got {invalid}.")
+
+        # Next state of a cell, indexed by 2 * neighbor count (0 to 8) + cell
+        # state; built once so the rules are never searched cell by cell
+        self._rule_table = np.zeros(18, dtype=np.uint8)
+        self._rule_table[[2 * count for count in self._birth_rules]] = 1
+        self._rule_table[[2 * count + 1 for count in self._survival_rules]] = 1
+
+        # The standard B3/S23 rules have a cheaper test than the table lookup
+        self._conway = self._birth_rules == {3} and self._survival_rules == {2, 3}
 
-        # Initialize the grid
-        self.grid = np.zeros((rows, columns), dtype=int)
+        # Initialize the grid (one byte per cell is enough for 0/1 states)
+        grid = np.zeros((rows, columns), dtype=np.uint8)
 
         # Helper function to place a pattern at a given position
         def place_pattern(grid, pattern, center_row, center_col):
@@ -73,29 +121,485 @@ class Game():
         if initial_pattern is not None:
             center_row = self.rows // 2
             center_col = self.columns // 2
-            place_pattern(self.grid, initial_pattern, center_row, center_col)
+            place_pattern(grid, np.asarray(initial_pattern), center_row, center_col)
+
+        self.grid = grid
+        self._allocate_buffers()
+
+    @property
+    def survival_rules(self):
+        """frozenset[int]: The neighbor counts for which a live cell survives."""
+        # Read-only, since the rule table (and each engine's copy of it) is
+        # built from the rules once; create a new game to change them
+        return self._survival_rules
+
+    @property
+    def birth_rules(self):
+        """frozenset[int]: The neighbor counts for which a dead cell is born."""
+        return self._birth_rules
+
+    @property
+    def grid(self):
+        """
+        np.ndarray: The (rows, columns) array of cell states.
+
+        The returned array is reused by later updates, which write new
+        generations into it, so copy it to keep a generation. An assigned
+        array is copied, so the caller's array is never modified.
+        """
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid):
+        # Any 0/1 array can be assigned, but the update works on contiguous
+        # uint8, and it reuses the array, so it is always copied
+        self._grid = np.array(grid, dtype=np.uint8, order='C')
+
+    def _allocate_buffers(self) -> None:
+        # Work arrays reused by every update instead of being reallocated
+        self._padded = np.zeros((self.rows + 2, self.columns + 2), dtype=np.uint8)
+        self._neighbors = np.empty((self.rows, self.columns), dtype=np.uint8)
+        self._buffer = np.empty((self.rows, self.columns), dtype=np.uint8)
+
+        # Sums of three horizontal neighbors for the rows of one band
+        self._band_rows = max(1, _BAND_BYTES // self.columns)
+        self._row_sums = np.empty((min(self._band_rows, self.rows) + 2, self.columns), dtype=np.uint8)
     
 
     def update(self) -> None:
-        # ... (update method is the same) ...
-        kernel = np.array([[1, 1, 1],
-                           [1, 0, 1],
-                           [1, 1, 1]])
+        """
+        Advances the simulation by one generation.
 
+        The grid is copied into the middle of a padded array whose border
+        repeats the opposite edges (a toroidal board), so the neighbors of
+        every cell are plain slices of it. The 3x3 block around each cell is
+        summed in two passes, three columns and then three rows, and the cell
+        itself is taken back out of the total. This is done band by band so
+        large grids are processed while still in cache. All the work happens
+        in arrays allocated once, and the new generation is written into a
+        second grid that is swapped with the current one.
+        """
+        grid = self.grid
 
-        total_neighbors = scipy.signal.convolve2d(self.grid, kernel, mode="same", boundary="wrap")
-        
-        new_grid = np.zeros_like(self.grid)
+        padded = self._padded
+        padded[1:-1, 1:-1] = grid
+        padded[0, 1:-1] = grid[-1]
+        padded[-1, 1:-1] = grid[0]
+        padded[:, 0] = padded[:, -2]
+        padded[:, -1] = padded[:, 1]
+
+        for top in range(0, self.rows, self._band_rows):
+            bottom = min(top + self._band_rows, self.rows)
+            window = padded[top:bottom + 2]
+            row_sums = self._row_sums[:bottom - top + 2]
+            neighbors = self._neighbors[top:bottom]
+            cells = grid[top:bottom]
 
+            np.add(window[:, :-2], window[:, 1:-1], out=row_sums)
+            np.add(row_sums, window[:, 2:], out=row_sums)
+            np.add(row_sums[:-2], row_sums[1:-1], out=neighbors)
+            np.add(neighbors, row_sums[2:], out=neighbors)
 
-        survival_mask = (self.grid == 1) & (np.isin(total_neighbors, self.survival_rules))
-        new_grid[survival_mask] = 1
+            if self._conway:
+                # Under B3/S23 a cell is alive next exactly when (count | state) == 3
+                np.subtract(neighbors, cells, out=neighbors)
+                np.bitwise_or(neighbors, cells, out=neighbors)
+                np.equal(neighbors, 3, out=self._buffer[top:bottom].view(bool))
+            else:
+                # Look up the next state of every cell in the combined rule
+                # table; 2 * (total - state) + state = 2 * total - state
+                np.left_shift(neighbors, 1, out=neighbors)
+                np.subtract(neighbors, cells, out=neighbors)
+                np.take(self._rule_table, neighbors, out=self._buffer[top:bottom], mode='clip')
 
+        # Swapped without the setter, which copies
+        self._grid, self._buffer = self._buffer, grid
 
-        birth_mask = (self.grid == 0) & (np.isin(total_neighbors, self.birth_rules))
-        new_grid[birth_mask] = 1
 
-        self.grid = new_grid
+# --- Bit-Packed Game Class ---
+
+class BitGame(Game):
+    """
+    A Game that stores each row of cells as bits packed into uint64 words.
+
+    Neighbor counts are computed with bitwise adders that handle 64 cells per
+    operation, which suits large, dense grids. The `grid` attribute unpacks
+    the bits on demand, so a BitGame can be rendered like any other Game;
+    assign a new array to `grid` instead of editing it in place.
+    """
+
+    def __init__(self, rows, columns, survival_rules=[2, 3], birth_rules=[3], initial_pattern=None) -> None:
+        """
+        Initializes the bit-packed board. Takes the same arguments as `Game`.
+
+        Attributes:
+            bits (np.ndarray): A (rows, ceil(columns / 64)) uint64 array, where
+                bit j % 64 of word j // 64 holds the cell in column j.
+        """
+        self._words = -(-columns // 64)
+        self._last_word = (columns - 1) // 64
+        self._last_bit = np.uint64((columns - 1) % 64)
+
+        # Keeps the unused bits past the last column cleared
+        self._last_word_mask = np.uint64((1 << ((columns - 1) % 64 + 1)) - 1)
+
+        super().__init__(rows, columns, survival_rules, birth_rules, initial_pattern)
+
+    def _allocate_buffers(self) -> None:
+        # The bitwise update works on its own packed arrays
+        pass
+
+    @property
+    def grid(self):
+        """np.ndarray: The cell states unpacked to a (rows, columns) uint8 array."""
+        as_bytes = self.bits.astype('<u8', copy=False).view(np.uint8)
+        return np.unpackbits(as_bytes, axis=1, count=self.columns, bitorder='little')
+
+    @grid.setter
+    def grid(self, grid):
+        packed = np.packbits(np.asarray(grid, dtype=bool), axis=1, bitorder='little')
+        as_bytes = np.zeros((packed.shape[0], self._words * 8), dtype=np.uint8)
+        as_bytes[:, :packed.shape[1]] = packed
+        self.bits = as_bytes.view('<u8').astype(np.uint64)
+
+    def _west(self, words):
+        # Bit j of the result is the cell at column j - 1
+        shifted = words << np.uint64(1)
+        shifted[:, 1:] |= words[:, :-1] >> np.uint64(63)
+        shifted[:, 0] |= (words[:, self._last_word] >> self._last_bit) & np.uint64(1)
+        return shifted
+
+    def _east(self, words):
+        # Bit j of the result is the cell at column j + 1
+        shifted = words >> np.uint64(1)
+        shifted[:, :-1] |= words[:, 1:] << np.uint64(63)
+        shifted[:, self._last_word] |= (words[:, 0] & np.uint64(1)) << self._last_bit
+        return shifted
+
+    @staticmethod
+    def _count_matches(planes, inverted, counts):
+        # Bitmask of the cells whose neighbor count is in `counts`. Counts 0-7
+        # are grouped by their two high bits, so each group costs at most
+        # three ANDs; a count of 8 is the only one that sets s3.
+        s0, s1, s2, s3 = planes
+        not_s0, not_s1, not_s2, not_s3 = inverted
+
+        matches = np.zeros_like(s0)
+        for high in range(4):
+            low_bits = {count & 1 for count in counts if count >> 1 == high}
+            if not low_bits:
+                continue
+
+            group = (s2 if high & 2 else not_s2) & (s1 if high & 1 else not_s1)
+            if low_bits == {0}:
+                group &= not_s0
+            elif low_bits == {1}:
+                group &= s0
+            matches |= group
+
+        matches &= not_s3
+        if 8 in counts:
+            matches |= s3
+        return matches
+
+    def update(self) -> None:
+        """
+        Advances the simulation by one generation using bitwise arithmetic.
+
+        Each row is summed once with a full adder over the cells to the west,
+        center and east; shifting those two-bit totals up and down gives the
+        totals of the rows above and below every cell. Adding them to the
+        side neighbors of the cell's own row yields four bit-planes holding
+        the neighbor count (0 to 8) of 64 cells per word.
+        """
+        bits = self.bits
+        west, east = self._west(bits), self._east(bits)
+
+        # Half adder over the two side neighbors of the cell's own row
+        mid0, mid1 = west ^ east, west & east
+
+        # Full adder over the three cells of each row, then moved to the
+        # rows below (as their "up" row) and above (as their "down" row)
+        row0 = mid0 ^ bits
+        row1 = mid1 | (mid0 & bits)
+        up0, up1 = np.roll(row0, 1, axis=0), np.roll(row1, 1, axis=0)
+        down0, down1 = np.roll(row0, -1, axis=0), np.roll(row1, -1, axis=0)
+
+        # Add the three two-bit totals into the count bit-planes s0..s3
+        s0 = up0 ^ mid0 ^ down0
+        carry = (up0 & mid0) | (down0 & (up0 ^ mid0))
+        twos = up1 ^ mid1 ^ down1
+        fours = (up1 & mid1) | (down1 & (up1 ^ mid1))
+        s1 = twos ^ carry
+        fours_carry = twos & carry
+        s2 = fours ^ fours_carry
+        s3 = fours & fours_carry
+
+        planes = (s0, s1, s2, s3)
+        inverted = tuple(~plane for plane in planes)
+        survive = self._count_matches(planes, inverted, self.survival_rules)
+        born = self._count_matches(planes, inverted, self.birth_rules)
+
+        new_bits = (bits & survive) | (~bits & born)
+        new_bits[:, -1] &= self._last_word_mask
+        self.bits = new_bits
+
+
+# --- Sparse Game Class ---
+
+class SparseGame(Game):
+    """
+    A Game that only recomputes the cells around the ones that just changed.
+
+    A cell can only change if something in its 3x3 neighborhood changed in
+    the previous step, so still lifes and slow-growing patterns leave most
+    of the board untouched. When more than `dense_fraction` of the board
+    changed, the full-grid update of `Game` is used instead.
+    """
+
+    # Share of the board above which the full-grid update is cheaper
+    dense_fraction = 0.01
+
+    def _allocate_buffers(self) -> None:
+        super()._allocate_buffers()
+
+        # Flat indices of the eight wrapped neighbors of every cell, computed
+        # once so the sparse update is a plain gather
+        index = np.arange(self.rows * self.columns, dtype=np.int32).reshape(self.rows, self.columns)
+        self._neighbor_table = np.stack(
+            [np.roll(index, (-dr, -dc), axis=(0, 1)).ravel()
+             for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc], axis=1)
+
+    @Game.grid.setter
+    def grid(self, grid):
+        Game.grid.fset(self, grid)
+        # Flat indices of the cells that changed in the last step, or None
+        # when every cell has to be recomputed (e.g. after assigning a grid)
+        self._changed = None
+
+    def _neighborhood(self, cells):
+        # The given flat indices plus their eight neighbors, deduplicated
+        return np.unique(np.concatenate((cells, self._neighbor_table[cells].ravel())))
+
+    def update(self) -> None:
+        """Advances the simulation by one generation."""
+        if self._changed is None or self._changed.size > self.dense_fraction * self.grid.size:
+            super().update()
+            # After the swap, the buffer still holds the previous generation
+            self._changed = np.flatnonzero(self.grid != self._buffer)
+            return
+
+        candidates = self._neighborhood(self._changed)
+        cells = self.grid.reshape(-1)
+        neighbors = cells[self._neighbor_table[candidates]].sum(axis=1, dtype=np.uint8)
+
+        states = cells[candidates]
+        new_states = self._rule_table[2 * neighbors + states]
+
+        # Flip only the cells whose state changed, in place
+        changed = candidates[new_states != states]
+        cells[changed] ^= 1
+        self._changed = changed
+
+
+# --- Numba Game Class ---
+
+def _numba_step(grid, out, rule_mask):
+    """
+    Writes the next generation of `grid` into `out` in a single pass.
+
+    Rows are split across threads. Only the first and last columns need
+    wrapped neighbor indices, so the loop over the interior columns has no
+    branches. The rules are an 18-bit mask whose bit 2 * count + state is
+    the next state; unlike a table lookup, shifting the mask lets the
+    compiler vectorize the interior loop.
+    """
+    rows, columns = grid.shape
+
+    for i in numba.prange(rows):
+        above = grid[i - 1 if i > 0 else rows - 1]
+        row = grid[i]
+        below = grid[i + 1 if i < rows - 1 else 0]
+        next_row = out[i]
+
+        for j in range(1, columns - 1):
+            neighbors = (np.uint32(above[j - 1]) + above[j] + above[j + 1]
+                         + row[j - 1] + row[j + 1]
+                         + below[j - 1] + below[j] + below[j + 1])
+            next_row[j] = (rule_mask >> (2 * neighbors + row[j])) & 1
+
+        # The edge columns wrap around to the opposite side
+        for j in (0, columns - 1):
+            left = j - 1 if j > 0 else columns - 1
+            right = j + 1 if j < columns - 1 else 0
+            neighbors = (np.uint32(above[left]) + above[j] + above[right]
+                         + row[left] + row[right]
+                         + below[left] + below[j] + below[right])
+            next_row[j] = (rule_mask >> (2 * neighbors + row[j])) & 1
+
+
+if numba is not None:
+    _numba_step = numba.njit(parallel=True, cache=True, boundscheck=False)(_numba_step)
+
+
+class NumbaGame(Game):
+    """
+    A Game whose update loop is compiled to machine code with Numba.
+
+    Counting neighbors and applying the rules happen in one multi-threaded
+    pass that reads the grid once and writes into a second, preallocated
+    grid; the two are swapped after every step. The first update pays a
+    one-off compilation cost, which is cached on disk for later runs.
+    """
+
+    def __init__(self, rows, columns, survival_rules=[2, 3], birth_rules=[3], initial_pattern=None) -> None:
+        """
+        Initializes the board. Takes the same arguments as `Game`.
+
+        Raises:
+            ImportError: If Numba is not installed.
+        """
+        if numba is None:
+            raise ImportError("NumbaGame requires the 'numba' package.")
+
+        super().__init__(rows, columns, survival_rules, birth_rules, initial_pattern)
+
+    def _allocate_buffers(self) -> None:
+        # The compiled kernel only needs the grid the next state is written to
+        self._buffer = np.empty_like(self.grid)
+
+        # The rule table packed into the bits of a single integer
+        self._rule_mask = np.uint32(sum(1 << int(index) for index in np.flatnonzero(self._rule_table)))
+
+    def update(self) -> None:
+        """Advances the simulation by one generation."""
+        _numba_step(self.grid, self._buffer, self._rule_mask)
+        self._grid, self._buffer = self._buffer, self._grid
+
+
+# --- CuPy Game Class ---
+
+class CupyGame(Game):
+    """
+    A Game that keeps the grid on a CUDA GPU and updates it with CuPy.
+
+    Every cell is independent, so the update runs at the GPU's memory
+    bandwidth; this pays off once the grid has a few hundred thousand cells.
+    The grid only leaves the device when the `grid` attribute is read, e.g.
+    to render a frame.
+    """
+
+    def __init__(self, rows, columns, survival_rules=[2, 3], birth_rules=[3], initial_pattern=None) -> None:
+        """
+        Initializes the board on the GPU. Takes the same arguments as `Game`.
+
+        Attributes:
+            device_grid (cupy.ndarray): The uint8 cell states on the GPU.
+
+        Raises:
+            ImportError: If CuPy is not installed.
+        """
+        if cupy is None:
+            raise ImportError("CupyGame requires the 'cupy' package.")
+
+        super().__init__(rows, columns, survival_rules, birth_rules, initial_pattern)
+
+    def _allocate_buffers(self) -> None:
+        # Device copies of the kernel and rule table, plus the work arrays
+        self._kernel = cupy.array([[1, 1, 1],
+                                   [1, 0, 1],
+                                   [1, 1, 1]], dtype=cupy.uint8)
+        self._device_rule_table = cupy.asarray(self._rule_table)
+        self._neighbors = cupy.empty((self.rows, self.columns), dtype=cupy.uint8)
+        self._buffer = cupy.empty((self.rows, self.columns), dtype=cupy.uint8)
+
+    @property
+    def grid(self):
+        """np.ndarray: The cell states, copied from the GPU to the host."""
+        return cupy.asnumpy(self.device_grid)
+
+    @grid.setter
+    def grid(self, grid):
+        self.device_grid = cupy.asarray(grid, dtype=cupy.uint8)
+
+    def update(self) -> None:
+        """Advances the simulation by one generation on the GPU."""
+        grid = self.device_grid
+        neighbors = self._neighbors
+
+        cupyx.scipy.ndimage.convolve(grid, self._kernel, output=neighbors, mode='wrap')
+
+        # Look up the next state of every cell in the combined rule table
+        cupy.left_shift(neighbors, 1, out=neighbors)
+        cupy.bitwise_or(neighbors, grid, out=neighbors)
+        cupy.take(self._device_rule_table, neighbors, out=self._buffer)
+
+        self.device_grid, self._buffer = self._buffer, grid
+
+
+# --- PyTorch Game Class ---
+
+class TorchGame(Game):
+    """
+    A Game that counts neighbors with PyTorch's 2D convolution.
+
+    Each update runs a single `conv2d` with circular padding on the chosen
+    device. On the CPU the grid tensor shares memory with NumPy and PyTorch
+    spreads the work over its threads; on one or two cores the plain `Game`
+    is usually faster. With a CUDA device the grid stays on the GPU, like in
+    `CupyGame`, and is only copied back when the `grid` attribute is read.
+    """
+
+    def __init__(self, rows, columns, survival_rules=[2, 3], birth_rules=[3], initial_pattern=None,
+                 device='cpu') -> None:
+        """
+        Initializes the board. Takes the same arguments as `Game`, plus:
+
+        Args:
+            device (str or torch.device): Where the grid is stored and updated,
+                                          e.g. 'cpu' or 'cuda'. Defaults to 'cpu'.
+
+        Attributes:
+            device_grid (torch.Tensor): The uint8 cell states on `device`.
+
+        Raises:
+            ImportError: If PyTorch is not installed.
+        """
+        if torch is None:
+            raise ImportError("TorchGame requires the 'torch' package.")
+
+        self.device = torch.device(device)
+        super().__init__(rows, columns, survival_rules, birth_rules, initial_pattern)
+
+    def _allocate_buffers(self) -> None:
+        # Tensors reused by every update, on the same device as the grid
+        self._kernel = torch.tensor([[1, 1, 1],
+                                     [1, 0, 1],
+                                     [1, 1, 1]], dtype=torch.float32, device=self.device).view(1, 1, 3, 3)
+        self._torch_rule_table = torch.from_numpy(self._rule_table).to(self.device)
+
+    @property
+    def grid(self):
+        """np.ndarray: The cell states, copied to the host if they are on a GPU."""
+        return self.device_grid.cpu().numpy()
+
+    @grid.setter
+    def grid(self, grid):
+        grid = np.ascontiguousarray(grid, dtype=np.uint8)
+        self.device_grid = torch.as_tensor(grid, device=self.device)
+
+    def update(self) -> None:
+        """Advances the simulation by one generation."""
+        grid = self.device_grid
+
+        cells = grid.view(1, 1, self.rows, self.columns).float()
+        padded = F.pad(cells, (1, 1, 1, 1), mode='circular')
+        neighbors = F.conv2d(padded, self._kernel).view(self.rows, self.columns)
+
+        # Look up the next state of every cell in the combined rule table; the
+        # counts are rounded since GPU convolution algorithms may not be exact
+        index = neighbors.round().long() * 2 + grid
+        self.device_grid = torch.take(self._torch_rule_table, index)
 
 
 # --- Renderer Class ---
@@ -122,57 +626,382 @@ class Renderer():
         self.figsize = figsize
         self.dpi = dpi
 
-    def render_frame(self, grid, step_num):
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        # The figure is built on the first frame and reused for the next ones
+        self._fig = None
+
+    def __getstate__(self):
+        # A pickled figure comes back without its Agg canvas, so worker
+        # processes started with 'spawn' or 'forkserver' build their own
+        state = self.__dict__.copy()
+        state['_fig'] = None
+        state.pop('_image', None)
+        state.pop('_title', None)
+        return state
 
-        ax.imshow(grid, cmap=self.cmap)
-        ax.set_title(f"Step: {step_num}", fontsize=14, fontname='Helvetica', pad=10)
+    def _create_figure(self, grid):
+        # Created without pyplot, so it never opens a window or has to be closed
+        fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+
+        # vmin/vmax are fixed because set_data doesn't rescale the colors
+        self._image = ax.imshow(grid, cmap=self.cmap, vmin=0, vmax=1)
+        self._title = ax.set_title("Step: 0", fontsize=14, fontname='Helvetica', pad=10)
         ax.set_xticks([])
         ax.set_yticks([])
 
-        plt.tight_layout(pad=0.2)
-        
+        fig.tight_layout(pad=0.2)
+        self._fig = fig
+
+    def render_frame(self, grid, step_num):
+        """
+        Draws the grid and returns it as an RGB image.
+
+        Only the image data and the title change from one frame to the next;
+        the figure, axes and layout are set up once.
+
+        Args:
+            grid (np.ndarray): The cell states to draw.
+            step_num (int): The step number shown in the title.
+
+        Returns:
+            np.ndarray: A (height, width, 3) uint8 array.
+        """
+        if self._fig is None or self._image.get_array().shape != grid.shape:
+            self._create_figure(grid)
+
+        fig = self._fig
+        self._image.set_data(grid)
+        self._title.set_text(f"Step: {step_num}")
+
         fig.canvas.draw()
 
-        # Pega dimensões corretas pelo renderer (funciona no Mac)
-        width, height = map(int, fig.canvas.renderer.get_canvas_width_height())
+        # The RGBA buffer is already shaped (height, width, 4), so no size
+        # lookup or string conversion is needed. The RGB channels are copied
+        # because the buffer is overwritten by the next draw.
+        return np.asarray(fig.canvas.buffer_rgba())[:, :, :3].copy()
+
+
+# --- Raster Renderer Class ---
+
+class RasterRenderer(Renderer):
+    """
+    A Renderer that paints frames with NumPy instead of Matplotlib.
+
+    Each cell becomes a square block of pixels colored through a palette
+    lookup, and the step number is written with Pillow in a band above the
+    grid. This is much faster than a Matplotlib draw, which makes it a good
+    fit for long GIFs; the live visualization still uses the Matplotlib
+    settings inherited from `Renderer`.
+    """
+
+    def __init__(self, cell_colors, figsize=(6, 6), dpi=160, cell_size=None, show_title=True):
+        """
+        Initializes the renderer with specific visualization parameters.
+
+        Args:
+            cell_colors (list): A list of colors for dead and alive cells.
+            figsize (tuple): The approximate frame size, in inches.
+            dpi (int): The resolution used to turn `figsize` into pixels.
+            cell_size (int, optional): The side of each cell in pixels. Defaults
+                                       to None, which fits the grid in `figsize`.
+            show_title (bool): Whether to write the step number above the grid.
+        """
+        super().__init__(cell_colors, figsize, dpi)
+        self.cell_size = cell_size
+        self.show_title = show_title
+
+        # RGB value of each cell state, so coloring a frame is a single lookup
+        self._palette = np.array([mcolors.to_rgb(color) for color in cell_colors]) * 255
+        self._palette = self._palette.round().astype(np.uint8)
+
+        # Same title size as the Matplotlib renderer (14 pt)
+        self._font_size = round(14 * dpi / 72)
+        self._font = ImageFont.load_default(size=self._font_size)
+        self._title_height = 2 * self._font_size
+
+    def __getstate__(self):
+        # Pillow fonts can't be pickled, so worker processes started with
+        # 'spawn' or 'forkserver' load their own copy of the font
+        state = super().__getstate__()
+        del state['_font']
+        return state
 
-        buffer = fig.canvas.tostring_argb()
-        plt.close(fig)
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._font = ImageFont.load_default(size=self._font_size)
 
-        # Converte buffer em array
-        image_argb = np.frombuffer(buffer, dtype=np.uint8).reshape((height, width, 4))
+    def render_frame(self, grid, step_num):
+        """
+        Draws the grid and returns it as an RGB image.
+
+        Args:
+            grid (np.ndarray): The cell states to draw.
+            step_num (int): The step number shown in the title.
+
+        Returns:
+            np.ndarray: A (height, width, 3) uint8 array.
+        """
+        cell_size = self.cell_size or max(1, int(min(self.figsize) * self.dpi) // max(grid.shape))
+
+        image = self._palette[grid]
+        image = np.repeat(np.repeat(image, cell_size, axis=0), cell_size, axis=1)
+        if not self.show_title:
+            return image
+
+        height, width = image.shape[:2]
+        title = Image.new("RGB", (width, self._title_height), "white")
+        ImageDraw.Draw(title).text((width / 2, self._title_height / 2), f"Step: {step_num}",
+                                   fill="black", font=self._font, anchor="mm")
+
+        frame = np.empty((self._title_height + height, width, 3), dtype=np.uint8)
+        frame[:self._title_height] = np.asarray(title)
+        frame[self._title_height:] = image
+        return frame
+
+
+# --- Gif Writer Class ---
+
+class _GifWriter:
+    """
+    Streams RGB frames into an animated GIF, one frame at a time.
+
+    A frame of the simulation only uses a handful of colors, so each frame is
+    mapped exactly onto its own palette instead of going through an adaptive
+    quantizer, which is most of the cost of writing a GIF with imageio.
+    Frames with more than 256 colors still fall back to Pillow's quantizer.
+    """
+
+    def __init__(self, output_filename, fps):
+        self._filename = output_filename
+        self._file = open(output_filename, 'wb')
+        self._duration = 1000 / fps
+        self._started = False
+
+        # Palette index of every 24-bit color, filled in for each frame's colors
+        self._color_index = np.zeros(1 << 24, dtype=np.uint8)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _pack(rgb):
+        rgb = rgb.astype(np.uint32)
+        return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+    def _to_palette_image(self, frame):
+        image = Image.fromarray(frame)
+        colors = image.getcolors(256)
+        if colors is None:
+            return image.quantize()
 
-        # ARGB → RGB
-        return image_argb[:, :, [1, 2, 3]]
+        palette = np.array([color for _, color in colors], dtype=np.uint8)
+        self._color_index[self._pack(palette)] = np.arange(len(palette))
+
+        image = Image.fromarray(self._color_index[self._pack(frame)], mode='P')
+        image.putpalette(palette.tobytes())
+        return image
+
+    def append_data(self, frame):
+        image = self._to_palette_image(frame)
+        if not self._started:
+            header, _ = GifImagePlugin.getheader(image, info={'loop': 0})
+            self._file.write(b"".join(header))
+            self._started = True
+
+        self._file.write(b"".join(GifImagePlugin.getdata(
+            image, duration=self._duration, disposal=2, include_color_table=True)))
+
+    def close(self):
+        if self._started:
+            self._file.write(b";")
+        self._file.close()
+
+        # A GIF needs at least one frame, so an empty file is not left behind
+        if not self._started:
+            os.remove(self._filename)
 
 
 # --- Create Gif Function ---
 
-def create_gif(game_instance, renderer_instance, steps, output_filename):
+def _init_render_worker(renderer_instance):
+    # Each worker process keeps its own copy of the renderer (and its figure)
+    global _worker_renderer
+    _worker_renderer = renderer_instance
+
+
+def _render_in_worker(grid, step_num):
+    return _worker_renderer.render_frame(grid, step_num)
+
+
+def _collect_cycle(game_instance, period):
+    # The current grid was seen `period` steps ago (through a repeated digest
+    # on rendered steps only, so the real period may divide it). Steps until
+    # the grid comes back and returns the grids of one cycle, or None (with
+    # the game restored) if it doesn't, i.e. the digests collided
+    cycle = [game_instance.grid.copy()]
+    for _ in range(period):
+        game_instance.update()
+        grid = game_instance.grid
+        if np.array_equal(grid, cycle[0]):
+            return cycle
+        cycle.append(grid.copy())
+
+    game_instance.grid = cycle[0]
+    return None
+
+
+def create_gif(game_instance, renderer_instance, steps, output_filename, workers=1, render_every=1):
     """
-    Creates and saves an animated GIF of the simulation.
+    Creates and saves an animation of the simulation as a GIF or an MP4 video.
+
+    The format follows the file extension: a '.mp4' file is encoded as H.264
+    video by ffmpeg (which needs the 'imageio-ffmpeg' package). The video is
+    much smaller for large frames, and ffmpeg encodes it on several cores.
 
     Args:
         game_instance (Game): The Game object to simulate.
         renderer_instance (Renderer): The Renderer object for visualization.
         steps (int): The total number of simulation steps to generate.
-        output_filename (str): The full path for the output GIF file.
+        output_filename (str): The full path for the output GIF (or MP4) file.
+        workers (int): The number of processes rendering frames in parallel.
+                       Defaults to 1, which renders in a background thread;
+                       more workers pay off with the Matplotlib `Renderer`
+                       on a multi-core machine.
+        render_every (int): Render only every n-th step. The simulation still
+                            runs all `steps`, but the animation has
+                            `render_every` times fewer frames. Defaults to 1.
     """
     print("Generating frames for the animation...")
 
-    with imageio.get_writer(output_filename, mode='I', fps=10, loop=0) as writer:
-        for step_num in tqdm(range(steps), desc="Generating GIF frames"):
-            frame = renderer_instance.render_frame(game_instance.grid, step_num)
-            writer.append_data(frame)
-            game_instance.update()
+    # Frames are rendered and the simulation stepped in a background thread
+    # while the main thread encodes the previous frames; the small queue
+    # keeps the two in step without holding the whole animation in memory
+    frames = queue.Queue(maxsize=2 * workers)
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(workers, initializer=_init_render_worker,
+                                       initargs=(renderer_instance,))
+
+    def render(grid, step_num):
+        if executor is None:
+            return renderer_instance.render_frame(grid, step_num)
+        # The grid is copied because the game reuses its arrays on the next update
+        return executor.submit(_render_in_worker, grid.copy(), step_num)
+
+    # Set when the encoder stops early, so the producer stops stepping the game
+    stop = threading.Event()
+
+    def produce_frames():
+        try:
+            # The step at which each rendered grid was seen, keyed by a short
+            # digest of its bytes. Once a grid comes back, the run has settled
+            # into a still life, an oscillator or a spaceship looping round the
+            # board, and the remaining frames replay that cycle instead of
+            # stepping. Skipped steps are neither digested nor read back from
+            # the game, which for some engines means unpacking or a device copy
+            seen = {}
+            cycle = None
+
+            for step_num in range(steps):
+                if stop.is_set():
+                    return
+
+                rendered = step_num % render_every == 0
+
+                if cycle is None and rendered:
+                    grid = game_instance.grid
+                    digest = hashlib.blake2b(grid, digest_size=8).digest()
+                    period = step_num - seen.get(digest, step_num)
+
+                    # Replaying only saves work if the cycle ends before the run
+                    if 0 < period < steps - step_num:
+                        cycle = _collect_cycle(game_instance, period)
+                        cycle_start = step_num
+                        # Collecting stepped the game, which may reuse the array
+                        grid = game_instance.grid
+                    seen[digest] = step_num
+
+                if cycle is not None:
+                    grid = cycle[(step_num - cycle_start) % len(cycle)]
+
+                if rendered:
+                    frames.put(render(grid, step_num))
+
+                if cycle is None:
+                    game_instance.update()
+
+            # Leave the game in the state it would have reached by stepping
+            if cycle is not None:
+                game_instance.grid = cycle[(steps - cycle_start) % len(cycle)]
+        except Exception as error:
+            frames.put(error)
+
+    producer = threading.Thread(target=produce_frames, daemon=True)
+
+    try:
+        # The writer is opened before the game is stepped, so a bad path or a
+        # missing encoder leaves the game untouched
+        extension = os.path.splitext(output_filename)[1].lower()
+        existed = os.path.exists(output_filename)
+        if extension == '.gif':
+            writer = _GifWriter(output_filename, fps=10)
+        elif extension == '.mp4':
+            # yuv420p plays everywhere but needs even frame sizes, so odd
+            # sizes are scaled up to the next even number
+            writer = imageio.get_writer(output_filename, fps=10, codec='libx264',
+                                        pixelformat='yuv420p', macro_block_size=2)
+        else:
+            writer = imageio.get_writer(output_filename, mode='I', fps=10, loop=0)
+
+        frame_steps = range(0, steps, render_every)
+        kind = extension.lstrip('.').upper() or "animation"
+
+        producer.start()
+        with writer:
+            for _ in tqdm(frame_steps, desc=f"Generating {kind} frames"):
+                frame = frames.get()
+                if isinstance(frame, Exception):
+                    raise frame
+                if isinstance(frame, Future):
+                    frame = frame.result()
+                writer.append_data(frame)
+
+        # The producer may still be running the steps after the last frame;
+        # anything it left in the queue can only be an error
+        producer.join()
+        if not frames.empty():
+            raise frames.get()
+    finally:
+        # On an error or Ctrl-C, unblock the producer and wait for it, so no
+        # thread is left stepping the game after this function returns
+        stop.set()
+        while producer.is_alive():
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                producer.join(timeout=0.01)
+
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    # Without frames a writer may still leave an empty or invalid file behind
+    if not frame_steps:
+        if not existed and os.path.exists(output_filename):
+            os.remove(output_filename)
+        print(f"\nNo frames to save, so '{output_filename}' was not written.")
+        return
 
     print(f"\nAnimation saved successfully to '{output_filename}'!")
 
 
 # --- Create Visualization Function ---
 
-def create_visualization(game_instance, renderer_instance, steps):
+def create_visualization(game_instance, renderer_instance, steps, frame_delay=0.1):
     """
     Generates a real-time visualization of the simulation in a pop-up window.
 
@@ -180,6 +1009,9 @@ def create_visualization(game_instance, renderer_instance, steps):
         game_instance (Game): The Game object to simulate.
         renderer_instance (Renderer): The Renderer object for visualization.
         steps (int): The total number of simulation steps to run.
+        frame_delay (float): The pause after each frame, in seconds, which sets
+                             the pace of the animation; 0 runs it as fast as
+                             the window can redraw. Defaults to 0.1.
     """
     print("Starting real-time visualization (close the window to stop)...")
     
@@ -190,13 +1022,20 @@ def create_visualization(game_instance, renderer_instance, steps):
     ax.set_xticks([])
     ax.set_yticks([])
 
+    # Create the image and title once and only update their data each step;
+    # vmin/vmax keep the colors fixed even when the first grid is uniform
+    im = ax.imshow(game_instance.grid, cmap=renderer_instance.cmap, vmin=0, vmax=1)
+    title = ax.set_title("Step: 0")
+
     for step_num in range(steps):
-        ax.imshow(game_instance.grid, cmap=renderer_instance.cmap)
-        ax.set_title(f"Step: {step_num}")
+        im.set_data(game_instance.grid)
+        title.set_text(f"Step: {step_num}")
         
         # Update the plot in real-time
-        plt.draw()
-        plt.pause(0.1)  # Pause for a brief moment to show the frame
+        fig.canvas.draw_idle()
+        # Let the GUI redraw and show the frame for a moment; a pause of 0
+        # would wait for the window forever, so the shortest one is 1 ms
+        plt.pause(max(frame_delay, 0.001))
         
         game_instance.update()
     
@@ -218,7 +1057,11 @@ if __name__ == '__main__':
     
     # --- DEFAULT TO A RANDOM INITIAL PATTERN ---
     # The random pattern is now the standard initial state, without asking the user.
-    initial_pattern = np.random.randint(0, 2, (matrix_size, matrix_size), dtype=int)
+    # One random bit per cell, drawn as raw bytes and unpacked into 0/1 values
+    rng = np.random.default_rng()
+    cell_count = matrix_size * matrix_size
+    random_bits = np.frombuffer(rng.bytes(-(-cell_count // 8)), dtype=np.uint8)
+    initial_pattern = np.unpackbits(random_bits, count=cell_count).reshape(matrix_size, matrix_size)
     
     # Define the rules and renderer
     current_survival_rules = [2, 3]
@@ -232,17 +1075,18 @@ if __name__ == '__main__':
                          birth_rules=current_birth_rules, 
                          initial_pattern=initial_pattern)
 
-    # Create the Renderer instance
-    renderer_instance = Renderer(cell_colors=cell_colors)
+    # --- GET USER'S CHOICE for output (gif, mp4 or live) ---
+    choice = input("Enter 'gif' to create an animated GIF, 'mp4' for an MP4 video "
+                   "(needs imageio-ffmpeg) or 'live' for real-time visualization: ").lower()
 
-    # --- GET USER'S CHOICE for output (gif or live) ---
-    choice = input("Enter 'gif' to create an animated GIF or 'live' for real-time visualization: ").lower()
+    if choice in ('gif', 'mp4'):
+        # GIF frames are painted directly, without Matplotlib
+        renderer_instance = RasterRenderer(cell_colors=cell_colors)
 
-    if choice == 'gif':
-        # --- Logic to create folder and filename for GIF file ---
+        # --- Logic to create folder and filename for the output file ---
         script_dir = os.path.dirname(__file__)
         project_root = os.path.dirname(script_dir)
-        output_dir = os.path.join(project_root, 'figures', 'gif', 'tests')
+        output_dir = os.path.join(project_root, 'figures', choice, 'tests')
         os.makedirs(output_dir, exist_ok=True)
         base_filename = os.path.splitext(os.path.basename(__file__))[0]
 
@@ -250,8 +1094,8 @@ if __name__ == '__main__':
         version = 1
         while True:
             version_str = f"v{version:03d}"
-            gif_filename = f"{base_filename}_{version_str}.gif"
-            full_path = os.path.join(output_dir, gif_filename)
+            output_filename = f"{base_filename}_{version_str}.{choice}"
+            full_path = os.path.join(output_dir, output_filename)
 
             if not os.path.exists(full_path):
                 break
@@ -260,6 +1104,7 @@ if __name__ == '__main__':
         create_gif(game_instance, renderer_instance, total_steps, full_path)
     
     elif choice == 'live':
+        renderer_instance = Renderer(cell_colors=cell_colors)
         create_visualization(game_instance, renderer_instance, total_steps)
     else:
         print("Invalid choice. Please run the script again and choose a valid option.")
\ No newline at end of file
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# gol.py is a script in src/, not an installed package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+# Numba's TBB threading layer can hang at interpreter exit once ffmpeg has been
+# run in the same process (the MP4 tests), so the suite uses Numba's own pool
+os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
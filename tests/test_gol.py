@@ -0,0 +1,243 @@
+"""Checks the Game engines and create_gif against straightforward references."""
+
+import functools
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import imageio
+import numpy as np
+import pytest
+from scipy.signal import convolve2d
+
+import gol
+
+# Optional library each engine needs, if any
+ENGINES = {
+    "Game": None,
+    "BitGame": None,
+    "SparseGame": None,
+    "NumbaGame": "numba",
+    "CupyGame": "cupy",
+    "TorchGame": "torch",
+}
+
+# (survival_rules, birth_rules): Conway, HighLife, a few rules that stress the
+# lookup (counts 0 and 8, no survival at all) and Day & Night
+RULES = [
+    ([2, 3], [3]),
+    ([2, 3], [3, 6]),
+    ([2, 3, 4, 5], [3]),
+    ([], [0, 1]),
+    ([0, 8], [2]),
+    ([3, 4, 6, 7, 8], [3, 6, 7, 8]),
+]
+
+# Odd shapes, widths just past a 64-bit word, and a width whose rows span
+# several bands of Game.update
+SHAPES = [(1, 1), (3, 3), (7, 65), (64, 128), (70, 4096)]
+
+NEIGHBORS = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
+
+
+def reference_step(grid, survival_rules, birth_rules):
+    neighbors = convolve2d(grid, NEIGHBORS, mode="same", boundary="wrap")
+    survive = (grid == 1) & np.isin(neighbors, survival_rules)
+    born = (grid == 0) & np.isin(neighbors, birth_rules)
+    return (survive | born).astype(np.uint8)
+
+
+@pytest.mark.parametrize("shape", SHAPES, ids=lambda shape: f"{shape[0]}x{shape[1]}")
+@pytest.mark.parametrize("survival_rules, birth_rules", RULES)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_matches_reference(engine, survival_rules, birth_rules, shape):
+    if ENGINES[engine] is not None:
+        pytest.importorskip(ENGINES[engine])
+
+    expected = np.random.default_rng(0).integers(0, 2, shape, dtype=np.uint8)
+    game = getattr(gol, engine)(*shape, survival_rules=survival_rules,
+                                birth_rules=birth_rules, initial_pattern=expected)
+    np.testing.assert_array_equal(game.grid, expected)
+
+    for _ in range(6):
+        expected = reference_step(expected, survival_rules, birth_rules)
+        game.update()
+        np.testing.assert_array_equal(game.grid, expected)
+
+
+def test_initial_pattern_can_be_a_nested_list():
+    game = gol.Game(4, 4, initial_pattern=[[1, 1], [1, 1]])
+
+    expected = np.zeros((4, 4), dtype=np.uint8)
+    expected[1:3, 1:3] = 1
+    np.testing.assert_array_equal(game.grid, expected)
+
+def test_sparse_game_follows_a_glider_across_the_edge(monkeypatch):
+    # A glider on a large board changes far fewer cells than dense_fraction,
+    # so after the first (full) update every step takes the sparse path
+    expected = np.zeros((200, 300), dtype=np.uint8)
+    expected[197:200, 297:300] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+    game = gol.SparseGame(200, 300)
+    game.grid = expected
+
+    sparse_updates = 0
+    neighborhood = game._neighborhood
+
+    def counted_neighborhood(cells):
+        nonlocal sparse_updates
+        sparse_updates += 1
+        return neighborhood(cells)
+
+    monkeypatch.setattr(game, "_neighborhood", counted_neighborhood)
+
+    for _ in range(40):
+        expected = reference_step(expected, [2, 3], [3])
+        game.update()
+        np.testing.assert_array_equal(game.grid, expected)
+
+    assert sparse_updates == 39
+
+@pytest.mark.parametrize("survival_rules, birth_rules, bad_rule", [
+    ([-1], [3], "survival_rules"),
+    ([2, 3], [3, 9], "birth_rules"),
+])
+def test_rules_outside_neighbor_counts_are_rejected(survival_rules, birth_rules, bad_rule):
+    with pytest.raises(ValueError, match=bad_rule):
+        gol.Game(5, 5, survival_rules=survival_rules, birth_rules=birth_rules)
+
+
+def test_rules_are_read_only():
+    game = gol.Game(5, 5, survival_rules=[2, 3], birth_rules=[3])
+    assert game.survival_rules == {2, 3} and game.birth_rules == {3}
+    with pytest.raises(AttributeError):
+        game.survival_rules = [1]
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_assigned_grid_is_not_modified(engine):
+    if ENGINES[engine] is not None:
+        pytest.importorskip(ENGINES[engine])
+
+    glider = np.zeros((8, 8), dtype=np.uint8)
+    glider[:3, :3] = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+    assigned = glider.copy()
+
+    game = getattr(gol, engine)(8, 8)
+    game.grid = assigned
+    for _ in range(4):
+        game.update()
+
+    np.testing.assert_array_equal(assigned, glider)
+
+def test_create_gif_replays_cycle_with_render_every(tmp_path):
+    # A blinker (period 2) in a 20x20 board, rendered every third step: the
+    # repeat is found between rendered steps and the rest of the run replays it
+    blinker = np.array([[0, 0, 0], [1, 1, 1], [0, 0, 0]])
+    steps, render_every = 40, 3
+    renderer = gol.RasterRenderer(["white", "black"], cell_size=2)
+
+    game = gol.Game(20, 20, initial_pattern=blinker)
+    updates = 0
+    update = game.update
+
+    def counted_update():
+        nonlocal updates
+        updates += 1
+        update()
+
+    game.update = counted_update
+    output = tmp_path / "blinker.gif"
+    gol.create_gif(game, renderer, steps, str(output), render_every=render_every)
+
+    reference = gol.Game(20, 20, initial_pattern=blinker)
+    expected = []
+    for step_num in range(steps):
+        if step_num % render_every == 0:
+            expected.append(renderer.render_frame(reference.grid, step_num))
+        reference.update()
+
+    frames = [frame[..., :3] for frame in imageio.mimread(output)]
+    assert len(frames) == len(expected)
+    for frame, expected_frame in zip(frames, expected):
+        np.testing.assert_array_equal(frame, expected_frame)
+
+    np.testing.assert_array_equal(game.grid, reference.grid)
+    assert updates < steps
+
+
+RENDERERS = {
+    "Renderer": lambda: gol.Renderer(["white", "black"], figsize=(1, 1), dpi=50),
+    "RasterRenderer": lambda: gol.RasterRenderer(["white", "black"], cell_size=2),
+}
+
+
+@pytest.mark.parametrize("renderer", RENDERERS)
+def test_renderer_pickles_after_drawing(renderer):
+    # Worker processes get their renderer by pickling, often after it drew
+    renderer = RENDERERS[renderer]()
+    grid = np.random.default_rng(1).integers(0, 2, (12, 12), dtype=np.uint8)
+    expected = renderer.render_frame(grid, 3)
+
+    np.testing.assert_array_equal(pickle.loads(pickle.dumps(renderer)).render_frame(grid, 3), expected)
+
+
+@pytest.mark.parametrize("renderer", RENDERERS)
+def test_create_gif_with_spawned_workers(renderer, tmp_path, monkeypatch):
+    renderer = RENDERERS[renderer]()
+    initial = np.random.default_rng(2).integers(0, 2, (12, 12), dtype=np.uint8)
+    renderer.render_frame(initial, 0)
+
+    game = gol.Game(12, 12, initial_pattern=initial)
+    gol.create_gif(game, renderer, 6, str(tmp_path / "one.gif"))
+
+    # 'spawn' is the default on macOS, and pickles everything sent to a worker
+    monkeypatch.setattr(gol, "ProcessPoolExecutor", functools.partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")))
+    pooled_game = gol.Game(12, 12, initial_pattern=initial)
+    gol.create_gif(pooled_game, renderer, 6, str(tmp_path / "pool.gif"), workers=2)
+
+    assert (tmp_path / "one.gif").read_bytes() == (tmp_path / "pool.gif").read_bytes()
+    np.testing.assert_array_equal(pooled_game.grid, game.grid)
+
+
+def test_gif_writer_maps_few_colors_exactly_and_quantizes_the_rest(tmp_path):
+    rng = np.random.default_rng(3)
+    palette = np.array([[255, 255, 255], [0, 0, 0], [200, 30, 60]], dtype=np.uint8)
+    few_colors = palette[rng.integers(0, 3, (20, 30))]
+    # 600 pixels of random colors, well over the 256 a GIF palette can hold
+    many_colors = rng.integers(0, 256, (20, 30, 3), dtype=np.uint8)
+
+    output = tmp_path / "colors.gif"
+    with gol._GifWriter(str(output), fps=10) as writer:
+        for frame in (few_colors, many_colors, few_colors):
+            writer.append_data(frame)
+
+    frames = [frame[..., :3] for frame in imageio.mimread(output)]
+    assert len(frames) == 3
+    np.testing.assert_array_equal(frames[0], few_colors)
+    np.testing.assert_array_equal(frames[2], few_colors)
+    assert np.abs(frames[1].astype(int) - many_colors).mean() < 16
+
+
+def test_create_gif_writes_mp4(tmp_path):
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+
+    # 25 x 3 = 75 pixels a side, odd, so the encoder has to pad the frames
+    game = gol.Game(25, 25, initial_pattern=np.random.default_rng(4).integers(0, 2, (25, 25)))
+    output = tmp_path / "run.mp4"
+    gol.create_gif(game, gol.RasterRenderer(["white", "black"], cell_size=3, show_title=False),
+                   12, str(output))
+
+    frame_count, _ = imageio_ffmpeg.count_frames_and_secs(str(output))
+    assert frame_count == 12
+
+
+@pytest.mark.parametrize("extension, requires", [(".gif", None), (".mp4", "imageio_ffmpeg")])
+def test_create_gif_without_frames_leaves_no_file(extension, requires, tmp_path):
+    if requires is not None:
+        pytest.importorskip(requires)
+
+    output = tmp_path / f"empty{extension}"
+    game = gol.Game(10, 10)
+    gol.create_gif(game, gol.RasterRenderer(["white", "black"]), 0, str(output))
+
+    assert not output.exists()